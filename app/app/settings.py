@@ -11,10 +11,14 @@ https://docs.djangoproject.com/en/2.1/ref/settings/
 """
 
 import os
+import sys
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Either `manage.py test` or pytest (including its xdist workers)
+TESTING = 'test' in sys.argv or 'pytest' in sys.modules
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/2.1/howto/deployment/checklist/
@@ -88,6 +92,32 @@ DATABASES = {
     }
 }
 
+# Tests never touch disk: every process (and so every xdist worker)
+# gets its own private in-memory database
+if TESTING:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+    # Test users don't need a slow, secure hash
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+    # Only what the admin tests need; the test client skips CSRF checks
+    # anyway and nothing asserts on security or clickjacking headers
+    MIDDLEWARE = [
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+    ]
+
+    LOGGING_CONFIG = None
+    DEBUG_PROPAGATE_EXCEPTIONS = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.1/ref/settings/#auth-password-validators
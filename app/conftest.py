@@ -0,0 +1,16 @@
+import shutil
+import tempfile
+import pytest
+
+
+@pytest.fixture(scope='session')
+def worker_media_root():
+    # each xdist worker gets its own directory so uploads never collide
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, worker_media_root):
+    settings.MEDIA_ROOT = worker_media_root
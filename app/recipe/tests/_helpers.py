@@ -0,0 +1,32 @@
+import functools
+from types import MappingProxyType
+from core.models import Ingredient, Recipe, Tag
+from django.urls import reverse
+
+RECIPE_DEFAULTS = MappingProxyType({
+    'title': 'Sample Recipe',
+    'time_in_minutes': 10,
+    'price': 5.00
+})
+
+
+@functools.lru_cache(maxsize=None)
+def image_upload_url(recipe_id):
+    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+
+
+@functools.lru_cache(maxsize=None)
+def detail_url(recipe_id):
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+def sample_tag(user, name='Main Course'):
+    return Tag.objects.create(user=user, name=name)
+
+
+def sample_ingredient(user, name='Arbitrary Ingredient'):
+    return Ingredient.objects.create(user=user, name=name)
+
+
+def sample_recipe(user, **params):
+    return Recipe.objects.create(user=user, **{**RECIPE_DEFAULTS, **params})
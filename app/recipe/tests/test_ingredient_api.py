@@ -2,7 +2,6 @@ from core.models import Ingredient
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
-from recipe.serializers import IngredientSerializer
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -10,9 +9,7 @@ URL = reverse('recipe:ingredient-list')
 
 
 class PublicIngredientsApiTests(TestCase):
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         response = self.client.get(URL)
@@ -21,27 +18,29 @@ class PublicIngredientsApiTests(TestCase):
 
 
 class PrivateIngredientsApiTests(TestCase):
+    client_class = APIClient
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'test@test.com',
             'testPass123'
         )
 
-        self.client = APIClient()
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
-    def retrieve(self):
+    def test_retrieve_ingredients(self):
         Ingredient.objects.create(user=self.user, name='Cucumber')
         Ingredient.objects.create(user=self.user, name='Basil')
 
         response = self.client.get(URL)
 
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+        ingredients = Ingredient.objects.all().order_by('-name') \
+            .values('id', 'name')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data, list(ingredients))
 
     def retrieve_limited_to_user(self):
         another_user = get_user_model().objects.create_user(
@@ -60,11 +59,14 @@ class PrivateIngredientsApiTests(TestCase):
 
     def test_create_successful(self):
         payload = {'name': 'Test Ingredient'}
-        self.client.post(URL, payload)
+        response = self.client.post(URL, payload)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['name'], payload['name'])
 
         exists = Ingredient.objects.filter(
-            user=self.user,
-            name=payload['name']
+            pk=response.data['id'],
+            user=self.user
         ).exists()
 
         self.assertTrue(exists)
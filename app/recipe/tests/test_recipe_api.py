@@ -1,48 +1,43 @@
+import io
 import os
-import tempfile
-from PIL import Image
-from core.models import Ingredient, Recipe, Tag
+from decimal import Decimal
+from core.models import Recipe
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from recipe.tests._helpers import detail_url, image_upload_url, \
+    sample_ingredient, sample_recipe, sample_tag
 from rest_framework import status
 from rest_framework.test import APIClient
 
 URL = reverse('recipe:recipe-list')
 
-
-def image_upload_url(recipe_id):
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
-
-
-def detail_url(recipe_id):
-    return reverse('recipe:recipe-detail', args=[recipe_id])
-
-
-def sample_tag(user, name='Main Course'):
-    return Tag.objects.create(user=user, name=name)
-
-
-def sample_ingredient(user, name='Arbitrary Ingredient'):
-    return Ingredient.objects.create(user=user, name=name)
-
-
-def sample_recipe(user, **params):
-    defaults = {
-        'title': 'Sample Recipe',
-        'time_in_minutes': 10,
-        'price': 5.00
-    }
-    defaults.update(params)
-
-    return Recipe.objects.create(user=user, **defaults)
+# 10x10 black JPEG, pre-encoded so the upload test doesn't run libjpeg
+SAMPLE_JPEG = (
+    b'\xff\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x00\x00\x01'
+    b'\x00\x01\x00\x00\xff\xdb\x00\x43\x00\x08\x06\x06\x07\x06\x05\x08'
+    b'\x07\x07\x07\x09\x09\x08\x0a\x0c\x14\x0d\x0c\x0b\x0b\x0c\x19\x12'
+    b'\x13\x0f\x14\x1d\x1a\x1f\x1e\x1d\x1a\x1c\x1c\x20\x24\x2e\x27\x20'
+    b'\x22\x2c\x23\x1c\x1c\x28\x37\x29\x2c\x30\x31\x34\x34\x34\x1f\x27'
+    b'\x39\x3d\x38\x32\x3c\x2e\x33\x34\x32\xff\xdb\x00\x43\x01\x09\x09'
+    b'\x09\x0c\x0b\x0c\x18\x0d\x0d\x18\x32\x21\x1c\x21\x32\x32\x32\x32'
+    b'\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32'
+    b'\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32'
+    b'\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\xff\xc0'
+    b'\x00\x11\x08\x00\x0a\x00\x0a\x03\x01\x22\x00\x02\x11\x01\x03\x11'
+    b'\x01\xff\xc4\x00\x15\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x08\xff\xc4\x00\x14\x10\x01\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xc4'
+    b'\x00\x14\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xff\xc4\x00\x14\x11\x01\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xda\x00\x0c\x03\x01'
+    b'\x00\x02\x11\x03\x11\x00\x3f\x00\x9f\xc0\x07\xff\xd9'
+)
 
 
 class PublicRecipesApiTests(TestCase):
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         response = self.client.get(URL)
@@ -51,27 +46,46 @@ class PublicRecipesApiTests(TestCase):
 
 
 class PrivateRecipesApiTests(TestCase):
+    client_class = APIClient
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'test@test.com',
             'testPass123'
         )
 
-        self.client = APIClient()
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
-    def retrieve(self):
-        Recipe.objects.create(user=self.user, title='My Recipe 1')
-        Recipe.objects.create(user=self.user, title='My Recipe 2')
-
-        response = self.client.get(URL)
-
-        recipes = Recipe.objects.all().order_by('-title')
-        serializer = RecipeSerializer(recipes, many=True)
+    def test_retrieve_recipes(self):
+        for title in ('My Recipe 1', 'My Recipe 2'):
+            recipe = sample_recipe(user=self.user, title=title)
+            recipe.tags.add(sample_tag(user=self.user))
+            recipe.ingredients.add(sample_ingredient(user=self.user))
+
+        # recipes, tags, ingredients; independent of the number of recipes
+        with self.assertNumQueries(3):
+            response = self.client.get(URL)
+
+        recipes = [
+            (
+                r.id, r.title, r.time_in_minutes, r.price, r.link,
+                [tag.id for tag in r.tags.all()],
+                [ingredient.id for ingredient in r.ingredients.all()]
+            )
+            for r in Recipe.objects.all().order_by('-title')
+        ]
+        retrieved = [
+            (
+                r['id'], r['title'], r['time_in_minutes'], Decimal(r['price']),
+                r['link'], r['tags'], r['ingredients']
+            )
+            for r in response.data
+        ]
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(retrieved, recipes)
 
     def retrieve_limited_to_user(self):
         another_user = get_user_model().objects.create_user(
@@ -94,20 +108,23 @@ class PrivateRecipesApiTests(TestCase):
             'time_in_minutes': 20,
             'price': 120.00
         }
-        self.client.post(URL, payload)
+        response = self.client.post(URL, payload)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['title'], payload['title'])
 
         exists = Recipe.objects.filter(
-            user=self.user,
-            title=payload['title']
+            pk=response.data['id'],
+            user=self.user
         ).exists()
 
         self.assertTrue(exists)
 
     def test_create_invalid(self):
-        payload = {'title': ''}
-        response = self.client.post(URL, payload)
+        serializer = RecipeSerializer(data={'title': ''})
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('title', serializer.errors)
 
     def test_view_detail(self):
         recipe = sample_recipe(self.user)
@@ -116,7 +133,9 @@ class PrivateRecipesApiTests(TestCase):
 
         url = detail_url(recipe.id)
 
-        response = self.client.get(url)
+        # recipe, tags, ingredients
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
 
         serializer = RecipeDetailSerializer(recipe)
 
@@ -203,14 +222,16 @@ class PrivateRecipesApiTests(TestCase):
 
 
 class RecipeImageUploadTests(TestCase):
+    client_class = APIClient
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'test@test.com',
             'testPass123'
         )
 
-        self.client = APIClient()
+    def setUp(self):
         self.client.force_authenticate(self.user)
         self.recipe = sample_recipe(user=self.user)
 
@@ -219,12 +240,10 @@ class RecipeImageUploadTests(TestCase):
 
     def test_upload_image_recipe(self):
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as ntf:
-            image = Image.new('RGB', (10, 10))
-            image.save(ntf, format='JPEG')
-            ntf.seek(0)  # to read the file, setting it to the BOF
-            response = self.client.post(
-                url, {'image': ntf}, format='multipart')
+        image = io.BytesIO(SAMPLE_JPEG)
+        image.name = 'test.jpg'
+        response = self.client.post(
+            url, {'image': image}, format='multipart')
 
         self.recipe.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
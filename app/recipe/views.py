@@ -55,6 +55,11 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
 
+        # only list and retrieve serialize both relations; the other
+        # actions just look the recipe up
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.prefetch_related('tags', 'ingredients')
+
         return queryset.filter(user=self.request.user) \
             .order_by('-title')
 